@@ -6,16 +6,34 @@ Supports multiple embedding models with different dimensions and comparison capa
 import os
 import json
 import pandas as pd
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Callable, Dict, List, Tuple, Optional, Any, TYPE_CHECKING
 from dataclasses import dataclass
-from sentence_transformers import SentenceTransformer
 import numpy as np
-from pinecone import Pinecone, ServerlessSpec
-import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+from pinecone import Pinecone, ServerlessSpec, Vector
 import time
+import threading
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+# sentence-transformers and plotly are imported where they are used so CLI
+# entry points that only need the model configurations start quickly
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+try:
+    # Optional: protobuf/HTTP2 transport for faster upserts (pip install "pinecone[grpc]")
+    from pinecone.grpc import PineconeGRPC
+except ImportError:
+    PineconeGRPC = None
+
+try:
+    import simsimd  # Optional: SIMD-accelerated similarity kernels
+except ImportError:
+    simsimd = None
+
+# Rank-metric kernels: precompiled metrics_aot when built, else numba JIT, else NumPy
+import metrics_numba
 
 @dataclass
 class EmbeddingModel:
@@ -25,6 +43,8 @@ class EmbeddingModel:
     dimensions: int
     description: str
     max_sequence_length: int = 512
+    precision: str = 'float32'  # 'float32', 'float16' or 'int8' for upserted vectors
+    onnx_quantize: bool = False  # int8 dynamic quantization of the ONNX Runtime graph
 
 # Available embedding models with their configurations
 EMBEDDING_MODELS = {
@@ -60,19 +80,279 @@ EMBEDDING_MODELS = {
     )
 }
 
+# Text columns read from the movies CSV
+MOVIE_TEXT_COLUMNS = ['title', 'overview', 'release_date', 'original_language']
+
+# Placeholder strings treated as missing values (matched case-insensitively)
+_BAD_VALUE_PATTERN = r'\s*(?:nan|none)?\s*'
+
+# Connection pool size for concurrent Pinecone requests
+PINECONE_POOL_THREADS = 16
+
+# Seconds a cached pc.list_indexes() result stays valid
+INDEX_LIST_TTL = 10.0
+
+# Number of (model, query) embeddings kept by EmbeddingComparisonSystem.encode_queries
+QUERY_CACHE_SIZE = 256
+
+# Default model weight cache (overridable with ST_CACHE), anchored to the project
+# directory so the web UI and the scripts/ CLIs share it whatever their working directory
+DEFAULT_MODEL_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.st_cache')
+
+# Corpus size from which embed_and_upload_movies encodes with a multi-process pool
+# (only when num_workers is passed explicitly)
+MULTI_PROCESS_THRESHOLD = 2000
+
+# Threads in the process-wide pool used for concurrent queries and uploads
+THREAD_POOL_SIZE = 8
+
+_thread_pool = None
+_thread_pool_lock = threading.Lock()
+
+def get_thread_pool() -> ThreadPoolExecutor:
+    """Return the process-wide thread pool, created on first use and kept for the process lifetime"""
+    global _thread_pool
+    with _thread_pool_lock:
+        if _thread_pool is None:
+            _thread_pool = ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE)
+        return _thread_pool
+
+# Each pool worker holds its own model copy, so at most one pool runs per process
+_MULTI_PROCESS_LOCK = threading.Lock()
+
+# Model held by each multi-process encode worker (set by _init_encode_worker)
+_worker_model = None
+
+def _init_encode_worker(model_id: str, cache_folder: str, num_threads: int):
+    """Process pool initializer: cap this worker's torch threads and load its model copy"""
+    global _worker_model
+    import torch
+    from sentence_transformers import SentenceTransformer
+    torch.set_num_threads(num_threads)
+    _worker_model = SentenceTransformer(model_id, device='cpu', cache_folder=cache_folder)
+
+def _encode_chunk(texts: List[str]) -> np.ndarray:
+    """Encode one shard of texts in a multi-process encode worker"""
+    return _worker_model.encode(
+        texts,
+        batch_size=64,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False
+    )
+
+def quantize_embeddings(embeddings: np.ndarray, precision: str = 'float32') -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Reduce embedding precision before upload, returning (values, per-vector scales)"""
+    if precision == 'float32':
+        return embeddings, None
+    if precision == 'float16':
+        return embeddings.astype(np.float16), None
+    if precision == 'int8':
+        # Symmetric scalar quantization; the scale is kept so vectors can be dequantized
+        scales = np.max(np.abs(embeddings), axis=1, keepdims=True) / 127
+        scales[scales == 0] = 1.0
+        return np.round(embeddings / scales).astype(np.int8), scales[:, 0]
+    raise ValueError(f"Unsupported precision: {precision}")
+
+def upsert_values(embeddings: np.ndarray) -> List[List[float]]:
+    """Convert a (possibly quantized) embedding batch to the float lists Pinecone accepts
+
+    The REST client rejects Python ints, so int8 values are sent as integer-valued floats.
+    """
+    return embeddings.astype(np.float32).tolist()
+
+def dequantize_embeddings(values: np.ndarray, scales: Optional[np.ndarray] = None) -> np.ndarray:
+    """Restore float32 embeddings from quantized values and their scales"""
+    embeddings = np.asarray(values, dtype=np.float32)
+    if scales is not None:
+        embeddings = embeddings * np.asarray(scales, dtype=np.float32).reshape(-1, 1)
+    return embeddings
+
+def _cosine_matrix(X: np.ndarray, Y: np.ndarray) -> np.ndarray:
+    """Pairwise cosine similarity between the rows of X and Y"""
+    X = np.atleast_2d(np.asarray(X, dtype=np.float32))
+    Y = np.atleast_2d(np.asarray(Y, dtype=np.float32))
+    if simsimd is not None:
+        return 1 - np.asarray(simsimd.cdist(X, Y, metric='cosine'))
+    
+    # Row norms via dot products rather than np.linalg.norm
+    x_norms = np.sqrt(np.einsum('ij,ij->i', X, X))
+    y_norms = np.sqrt(np.einsum('ij,ij->i', Y, Y))
+    denom = np.outer(x_norms, y_norms)
+    denom[denom == 0] = 1.0
+    return (X @ Y.T) / denom
+
+def _comparison_metrics(results1: List[Dict], results2: List[Dict], top_k: int) -> Dict[str, float]:
+    """Average similarity per model and title overlap between two result lists"""
+    avg1 = (sum(r['similarity_score'] for r in results1) / len(results1)) if results1 else 0.0
+    avg2 = (sum(r['similarity_score'] for r in results2) / len(results2)) if results2 else 0.0
+    
+    # Find common movies between results without materializing a second set
+    titles1 = {r['title'] for r in results1}
+    common = len(titles1.intersection(r['title'] for r in results2))
+    
+    return {
+        'model1_avg_similarity': avg1,
+        'model2_avg_similarity': avg2,
+        'common_movies': common,
+        'overlap_percentage': (common / top_k) * 100 if top_k > 0 else 0
+    }
+
+def result_cohesion(results: List[Dict]) -> float:
+    """Mean pairwise cosine between the float32 vectors of a result list (needs include_vectors)"""
+    vectors = [r['vector'] for r in results if r.get('vector') is not None]
+    if len(vectors) < 2:
+        return 0.0
+    
+    V = np.stack(vectors)
+    similarities = _cosine_matrix(V, V)
+    upper = np.triu_indices(len(vectors), k=1)
+    return float(similarities[upper].mean())
+
+def rank_metrics(results1: List[Dict], results2: List[Dict]) -> Dict[str, float]:
+    """Cosine, dot product and squared L2 between the two models' rank-ordered similarity scores"""
+    n = min(len(results1), len(results2))
+    s1 = np.fromiter((r['similarity_score'] for r in results1[:n]), dtype=np.float32, count=n)
+    s2 = np.fromiter((r['similarity_score'] for r in results2[:n]), dtype=np.float32, count=n)
+    if n == 0:
+        return {'score_cosine': 0.0, 'score_dot': 0.0, 'score_sq_l2': 0.0}
+    
+    return {
+        'score_cosine': float(metrics_numba.cosine(s1, s2)),
+        'score_dot': float(metrics_numba.dot(s1, s2)),
+        'score_sq_l2': float(metrics_numba.sq_l2(s1, s2))
+    }
+
+class OnnxSentenceEncoder:
+    """ONNX Runtime encoder mirroring SentenceTransformer.encode (mean pooling)"""
+    
+    def __init__(self, model, tokenizer, max_length: int = 512):
+        self.model = model
+        self.tokenizer = tokenizer
+        self.max_length = min(tokenizer.model_max_length, max_length)
+    
+    def encode(self, sentences, batch_size: int = 32, show_progress_bar: bool = False,
+               convert_to_numpy: bool = True, normalize_embeddings: bool = False) -> np.ndarray:
+        """Encode sentences into a (N, D) float32 array"""
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+        
+        # Sort by length so each batch is padded as little as possible
+        order = np.argsort([-len(s) for s in sentences], kind='stable')
+        embeddings = []
+        for start in range(0, len(sentences), batch_size):
+            batch = [sentences[i] for i in order[start:start + batch_size]]
+            inputs = self.tokenizer(batch, padding=True, truncation=True,
+                                    max_length=self.max_length, return_tensors='np')
+            token_embeddings = self.model(**inputs).last_hidden_state
+            token_embeddings = np.asarray(token_embeddings, dtype=np.float32)
+            mask = inputs['attention_mask'][..., None].astype(np.float32)
+            embeddings.append((token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None))
+        
+        if embeddings:
+            embeddings = np.concatenate(embeddings)[np.argsort(order)]
+        else:
+            embeddings = np.zeros((0, 0), dtype=np.float32)
+        if normalize_embeddings and len(embeddings):
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+        return embeddings[0] if single else embeddings
+
+def _max_seq_length(hub_id: str, cache_folder: str, default: int) -> int:
+    """Truncation length SentenceTransformer uses for a model (max_seq_length in sentence_bert_config.json)"""
+    from huggingface_hub import hf_hub_download
+    from huggingface_hub.utils import HfHubHTTPError
+    try:
+        config_path = hf_hub_download(hub_id, 'sentence_bert_config.json', cache_dir=cache_folder)
+        with open(config_path, 'r') as f:
+            return int(json.load(f)['max_seq_length'])
+    except (OSError, ValueError, KeyError, HfHubHTTPError) as e:
+        print(f"Could not read max_seq_length for {hub_id}, using {default}: {e}")
+        return default
+
+def _build_encoder(model_config: EmbeddingModel, device: str, cache_folder: str):
+    """Build an ONNX Runtime encoder for a model, falling back to SentenceTransformer"""
+    if device == 'cpu':
+        try:
+            from optimum.onnxruntime import ORTModelForFeatureExtraction
+            from transformers import AutoTokenizer
+        except ImportError:
+            pass
+        else:
+            hub_id = model_config.model_id
+            if '/' not in hub_id:
+                hub_id = f"sentence-transformers/{hub_id}"
+            export_dir = os.path.join(cache_folder, 'onnx', model_config.model_id.replace('/', '_'))
+            try:
+                tokenizer = AutoTokenizer.from_pretrained(hub_id, cache_dir=cache_folder)
+                if os.path.isdir(export_dir):
+                    model = ORTModelForFeatureExtraction.from_pretrained(export_dir)
+                else:
+                    model = ORTModelForFeatureExtraction.from_pretrained(
+                        hub_id, export=True, provider='CPUExecutionProvider', cache_dir=cache_folder
+                    )
+                    model.save_pretrained(export_dir)
+                if model_config.onnx_quantize:
+                    model = _quantize_onnx_model(model, export_dir)
+                # Truncate exactly where SentenceTransformer would, so both backends embed the same tokens
+                max_length = _max_seq_length(hub_id, cache_folder, model_config.max_sequence_length)
+                return OnnxSentenceEncoder(model, tokenizer, max_length)
+            except Exception as e:
+                print(f"ONNX export failed for {model_config.name}, using SentenceTransformer: {e}")
+    
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_config.model_id, device=device, cache_folder=cache_folder)
+
+def _quantize_onnx_model(model, export_dir: str):
+    """Apply int8 dynamic quantization to an exported ONNX model"""
+    from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    
+    quantized_dir = f"{export_dir}-int8"
+    if not os.path.isdir(quantized_dir):
+        quantizer = ORTQuantizer.from_pretrained(model)
+        qconfig = AutoQuantizationConfig.avx2(is_static=False, per_channel=False)
+        quantizer.quantize(save_dir=quantized_dir, quantization_config=qconfig)
+    return ORTModelForFeatureExtraction.from_pretrained(quantized_dir, file_name='model_quantized.onnx')
+
 class EmbeddingComparisonSystem:
     """Main system for comparing different embedding models and dimensions"""
     
     def __init__(self, pinecone_api_key: str):
-        self.pc = Pinecone(api_key=pinecone_api_key)
+        client_class = PineconeGRPC if PineconeGRPC is not None else Pinecone
+        self.pc = client_class(api_key=pinecone_api_key, pool_threads=PINECONE_POOL_THREADS)
         self.models = {}
         self.loaded_models = {}
+        self._query_cache = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self._index_names = None
+        self._index_names_fetched = 0.0
+        self.device = self._configure_torch()
+    
+    @staticmethod
+    def _configure_torch() -> str:
+        """Cap torch thread pools and pick the device models are loaded on"""
+        import torch
+        # Roughly one intra-op thread per physical core; oversubscribing hurts encode under concurrency
+        torch.set_num_threads(max((os.cpu_count() or 2) // 2, 1))
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Can only be set once per process, before any parallel work has started
+            pass
+        return 'cuda' if torch.cuda.is_available() else 'cpu'
         
-    def load_model(self, model_config: EmbeddingModel) -> SentenceTransformer:
-        """Load a specific embedding model"""
+    def load_model(self, model_config: EmbeddingModel) -> Any:
+        """Load a specific embedding model (ONNX Runtime when available)"""
         if model_config.model_id not in self.loaded_models:
             print(f"Loading model: {model_config.name}")
-            self.loaded_models[model_config.model_id] = SentenceTransformer(model_config.model_id)
+            self.loaded_models[model_config.model_id] = _build_encoder(
+                model_config,
+                device=self.device,
+                # Shared on-disk cache so every script reuses downloaded weights
+                cache_folder=os.getenv('ST_CACHE', DEFAULT_MODEL_CACHE)
+            )
         return self.loaded_models[model_config.model_id]
     
     def create_index(self, model_config: EmbeddingModel, index_suffix: str = "") -> str:
@@ -81,84 +361,226 @@ class EmbeddingComparisonSystem:
         clean_name = model_config.name.replace('_', '-').lower()
         index_name = f"movies-{clean_name}-{model_config.dimensions}{index_suffix}"
         
-        # Delete existing index if it exists
-        if index_name in self.pc.list_indexes().names():
+        # Embeddings are L2-normalized at encode time, so dot product equals cosine
+        # without the server renormalizing every vector; int8 vectors carry a
+        # per-vector scale and still need cosine
+        metric = 'cosine' if model_config.precision == 'int8' else 'dotproduct'
+        
+        index_names = self._list_index_names()
+        if index_name in index_names:
+            # Reuse a compatible index, cleared so the next upload defines its contents
+            # (upserts only overwrite by id, so vectors from a larger earlier dataset would remain)
+            description = self.pc.describe_index(index_name)
+            if description.dimension == model_config.dimensions and description.metric == metric:
+                index = self.pc.Index(index_name)
+                if index.describe_index_stats().total_vector_count:
+                    index.delete(delete_all=True)
+                print(f"Reusing existing index: {index_name} (cleared)")
+                return index_name
+            
+            # Delete existing index if its dimension or metric differs
             print(f"Deleting existing index: {index_name}")
             self.pc.delete_index(index_name)
+            index_names.discard(index_name)
         
         # Create new index
         self.pc.create_index(
             name=index_name,
             dimension=model_config.dimensions,
-            metric='cosine',
+            metric=metric,
             spec=ServerlessSpec(
                 cloud='aws',
                 region='us-west-2'
             )
         )
         
-        print(f"Created index: {index_name} with {model_config.dimensions} dimensions")
+        index_names.add(index_name)
+        
+        print(f"Created index: {index_name} with {model_config.dimensions} dimensions ({metric})")
         return index_name
     
+    def _list_index_names(self) -> set:
+        """Return the names of existing indices, cached for INDEX_LIST_TTL seconds"""
+        now = time.monotonic()
+        if self._index_names is None or now - self._index_names_fetched > INDEX_LIST_TTL:
+            self._index_names = set(self.pc.list_indexes().names())
+            self._index_names_fetched = now
+        return self._index_names
+    
     def embed_and_upload_movies(self, movies: List[Dict], model_config: EmbeddingModel, 
-                              index_name: str, batch_size: int = 32) -> None:
-        """Embed movies and upload to Pinecone"""
+                              index_name: str, batch_size: int = 32,
+                              num_workers: Optional[int] = None,
+                              progress_cb: Optional[Callable[[int, int], None]] = None) -> None:
+        """Embed movies (as returned by load_movies_from_csv) and upload to Pinecone
+        
+        num_workers > 1 opts in to multi-process CPU encoding for corpora of at least
+        MULTI_PROCESS_THRESHOLD texts (capped at the CPU count); each worker loads its own
+        SentenceTransformer copy. progress_cb, if given, is called as progress_cb(uploaded, total) after
+        each upsert batch.
+        """
         model = self.load_model(model_config)
-        index = self.pc.Index(index_name)
+        index = self.pc.Index(index_name, pool_threads=PINECONE_POOL_THREADS)
         
         print(f"Embedding {len(movies)} movies with {model_config.name}")
         
+        texts = [m['overview'] if m['overview'] else '' for m in movies]
+        cpu_count = os.cpu_count() or 1
+        
+        if (num_workers is not None and num_workers > 1 and len(texts) >= MULTI_PROCESS_THRESHOLD
+                and self.device == 'cpu' and not isinstance(model, OnnxSentenceEncoder)):
+            # Large ingests: shard the texts across worker processes, each limited
+            # to its share of the cores (torch.set_num_threads is per process)
+            num_workers = min(num_workers, cpu_count)
+            print(f"Encoding with {num_workers} worker processes")
+            initargs = (model_config.model_id, os.getenv('ST_CACHE', DEFAULT_MODEL_CACHE),
+                        max(cpu_count // num_workers, 1))
+            # A few shards per worker so an unlucky long shard doesn't stall the pool
+            shard_size = max(len(texts) // (num_workers * 4), 1)
+            shards = [texts[i:i + shard_size] for i in range(0, len(texts), shard_size)]
+            with _MULTI_PROCESS_LOCK, ProcessPoolExecutor(
+                    max_workers=num_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_encode_worker,
+                    initargs=initargs) as pool:
+                embeddings = np.concatenate(list(pool.map(_encode_chunk, shards)))
+        else:
+            # Generate all embeddings in a single call; sentence-transformers sorts
+            # the texts by length internally so each mini-batch carries little padding
+            embeddings = model.encode(
+                texts,
+                batch_size=64,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=True
+            )
+        embeddings, scales = quantize_embeddings(embeddings, model_config.precision)
+        
+        model_name = model_config.name
+        dimensions = model_config.dimensions
+        
+        # Keep a struct-of-arrays layout (embedding matrix + parallel id and
+        # metadata lists) and only build Vector objects per upsert batch.
+        # Values are already cleaned by load_movies_from_csv
+        ids = [str(m['id']) for m in movies]
+        metadatas = [
+            {
+                'title': m['title'],
+                'overview': m['overview'],
+                'release_date': m['release_date'],
+                'original_language': m['original_language'],
+                'model_name': model_name,
+                'dimensions': dimensions
+            }
+            for m in movies
+        ]
+        if scales is not None:
+            for metadata, scale in zip(metadatas, scales.tolist()):
+                metadata['quantization_scale'] = scale
+        
+        async_results = []
         for i in range(0, len(movies), batch_size):
-            batch = movies[i:i+batch_size]
-            texts = [m['overview'] if m['overview'] else '' for m in batch]
-            ids = [str(m['id']) for m in batch]
-            
-            # Generate embeddings
-            embeddings = model.encode(texts)
+            # Convert the whole slice in one C-level call rather than per vector
+            batch_values = upsert_values(embeddings[i:i+batch_size])
+            vectors = [
+                Vector(id=ids[i + j], values=values, metadata=metadatas[i + j])
+                for j, values in enumerate(batch_values)
+            ]
             
-            # Prepare vectors for Pinecone
-            vectors = []
-            for j, (movie_id, embedding, movie) in enumerate(zip(ids, embeddings, batch)):
-                # Clean metadata to handle NaN values and ensure JSON serialization
-                def clean_value(value):
-                    """Clean a value for JSON serialization"""
-                    if pd.isna(value) or value is None or str(value).lower() in ['nan', 'none', '']:
-                        return "Unknown"
-                    return str(value)
-                
-                metadata = {
-                    'title': clean_value(movie['title']),
-                    'overview': clean_value(movie['overview']),
-                    'release_date': clean_value(movie['release_date']),
-                    'original_language': clean_value(movie['original_language']),
-                    'model_name': model_config.name,
-                    'dimensions': model_config.dimensions
-                }
-                vectors.append((movie_id, embedding.tolist(), metadata))
-            
-            # Upload to Pinecone
-            index.upsert(vectors)
-            
-            if (i + batch_size) % 100 == 0:
-                print(f"Processed {min(i + batch_size, len(movies))}/{len(movies)} movies")
+            # Upload to Pinecone without waiting for the previous batch
+            async_results.append(index.upsert(vectors=vectors, async_req=True))
+        
+        # Wait for all in-flight upserts (raises if any batch failed)
+        for processed, result in enumerate(async_results, 1):
+            # gRPC returns futures, the REST client returns ApplyResult objects
+            if hasattr(result, 'result'):
+                result.result()
+            else:
+                result.get()
+            uploaded = min(processed * batch_size, len(movies))
+            if progress_cb is not None:
+                progress_cb(uploaded, len(movies))
+            if (processed * batch_size) % 100 == 0:
+                print(f"Processed {uploaded}/{len(movies)} movies")
     
     def search_movies(self, query: str, model_config: EmbeddingModel, 
-                     index_name: str, top_k: int = 5) -> List[Dict]:
-        """Search for similar movies using a specific model"""
-        model = self.load_model(model_config)
+                     index_name: str, top_k: int = 5,
+                     vector: Optional[np.ndarray] = None,
+                     include_vectors: bool = False) -> List[Dict]:
+        """Search for similar movies using a specific model (optionally with a precomputed query vector)
+        
+        With include_vectors=True each result also carries its stored vector as a float32 'vector' array.
+        """
+        if vector is not None:
+            return self._query_index(self.pc.Index(index_name), np.asarray(vector), top_k,
+                                     model_config, include_vectors)
+        return self.search_movies_batch([query], model_config, index_name, top_k, include_vectors)[0]
+    
+    def search_movies_batch(self, queries: List[str], model_config: EmbeddingModel,
+                            index_name: str, top_k: int = 5,
+                            include_vectors: bool = False) -> List[List[Dict]]:
+        """Search for similar movies for several queries with a single encode call"""
+        query_embeddings = self.encode_queries(queries, model_config)
         index = self.pc.Index(index_name)
+        return [self._query_index(index, query_embedding, top_k, model_config, include_vectors)
+                for query_embedding in query_embeddings]
+    
+    def encode_query(self, query: str, model_config: EmbeddingModel) -> np.ndarray:
+        """Encode a single query into a normalized embedding"""
+        return self.encode_queries([query], model_config)[0]
+    
+    def encode_queries(self, queries: List[str], model_config: EmbeddingModel) -> np.ndarray:
+        """Encode queries, reusing cached embeddings for repeated (model, query) pairs"""
+        model_id = model_config.model_id
+        embeddings = {}
+        with self._query_cache_lock:
+            for query in queries:
+                key = (model_id, query)
+                if key in self._query_cache:
+                    self._query_cache.move_to_end(key)
+                    embeddings[query] = self._query_cache[key]
         
-        # Generate query embedding
-        query_embedding = model.encode([query])
+        missing = [q for q in dict.fromkeys(queries) if q not in embeddings]
+        if missing:
+            model = self.load_model(model_config)
+            # Generate all missing embeddings in one pass (sentence-transformers
+            # length-sorts inputs internally to minimise padding)
+            new_embeddings = model.encode(
+                missing,
+                batch_size=64,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False
+            )
+            with self._query_cache_lock:
+                for query, embedding in zip(missing, new_embeddings):
+                    embeddings[query] = embedding
+                    self._query_cache[(model_id, query)] = embedding
+                while len(self._query_cache) > QUERY_CACHE_SIZE:
+                    self._query_cache.popitem(last=False)
         
-        # Search in Pinecone
+        if not queries:
+            return np.zeros((0, model_config.dimensions), dtype=np.float32)
+        return np.stack([embeddings[q] for q in queries])
+    
+    def _query_index(self, index, vector: np.ndarray, top_k: int,
+                     model_config: EmbeddingModel, include_vectors: bool = False) -> List[Dict]:
+        """Query a Pinecone index with a precomputed embedding"""
         results = index.query(
-            vector=query_embedding[0].tolist(),
+            vector=vector.tolist(),
             top_k=top_k,
-            include_metadata=True
+            include_metadata=True,
+            include_values=include_vectors
         )
-        
-        # Format results
+        similar_movies = self._format_matches(results, model_config)
+        if include_vectors:
+            for movie_info, match in zip(similar_movies, results['matches']):
+                # int8 vectors are stored as integer values; restore their float scale
+                scale = match['metadata'].get('quantization_scale')
+                movie_info['vector'] = dequantize_embeddings([match['values']], None if scale is None else [scale])[0]
+        return similar_movies
+    
+    def _format_matches(self, results, model_config: EmbeddingModel) -> List[Dict]:
+        """Format Pinecone query matches into movie dictionaries"""
         similar_movies = []
         for match in results['matches']:
             movie_info = {
@@ -177,65 +599,106 @@ class EmbeddingComparisonSystem:
     
     def compare_models(self, query: str, model1_config: EmbeddingModel, 
                       model2_config: EmbeddingModel, index1_name: str, 
-                      index2_name: str, top_k: int = 5) -> Dict[str, Any]:
+                      index2_name: str, top_k: int = 5,
+                      vector1: Optional[np.ndarray] = None,
+                      vector2: Optional[np.ndarray] = None) -> Dict[str, Any]:
         """Compare results from two different models"""
+        embeddings1 = None if vector1 is None else np.asarray(vector1)[None, :]
+        embeddings2 = None if vector2 is None else np.asarray(vector2)[None, :]
+        return self.compare_models_batch([query], model1_config, model2_config,
+                                         index1_name, index2_name, top_k,
+                                         embeddings1, embeddings2)[0]
+    
+    def compare_models_batch(self, queries: List[str], model1_config: EmbeddingModel,
+                             model2_config: EmbeddingModel, index1_name: str,
+                             index2_name: str, top_k: int = 5,
+                             embeddings1: Optional[np.ndarray] = None,
+                             embeddings2: Optional[np.ndarray] = None,
+                             executor: Optional[Executor] = None) -> List[Dict[str, Any]]:
+        """Compare results from two different models for several queries
+        
+        Queries run on executor, defaulting to the shared get_thread_pool().
+        """
         print(f"Comparing models: {model1_config.name} vs {model2_config.name}")
         
-        # Get results from both models
-        results1 = self.search_movies(query, model1_config, index1_name, top_k)
-        results2 = self.search_movies(query, model2_config, index2_name, top_k)
+        # Encode once per model unless precomputed; the query cache makes the
+        # second call free when both indices use the same model
+        if embeddings1 is None:
+            embeddings1 = self.encode_queries(queries, model1_config)
+        if embeddings2 is None:
+            embeddings2 = self.encode_queries(queries, model2_config)
+        index1 = self.pc.Index(index1_name)
+        index2 = self.pc.Index(index2_name)
+        
+        # Query both indices concurrently
+        if executor is None:
+            executor = get_thread_pool()
+        futures1 = [executor.submit(self._query_index, index1, v, top_k, model1_config) for v in embeddings1]
+        futures2 = [executor.submit(self._query_index, index2, v, top_k, model2_config) for v in embeddings2]
+        batch_results1 = [f.result() for f in futures1]
+        batch_results2 = [f.result() for f in futures2]
         
+        return [
+            self.build_comparison(query, model1_config, model2_config, results1, results2, top_k)
+            for query, results1, results2 in zip(queries, batch_results1, batch_results2)
+        ]
+    
+    @staticmethod
+    def build_comparison(query: str, model1_config: EmbeddingModel, model2_config: EmbeddingModel,
+                         results1: List[Dict], results2: List[Dict], top_k: int = 5) -> Dict[str, Any]:
+        """Build the comparison summary for two result lists (no I/O)"""
         # Calculate comparison metrics
-        comparison = {
+        metrics = _comparison_metrics(results1, results2, top_k)
+        return {
             'query': query,
             'model1': {
                 'name': model1_config.name,
                 'dimensions': model1_config.dimensions,
                 'results': results1,
-                'avg_similarity': np.mean([r['similarity_score'] for r in results1]) if results1 else 0
+                'avg_similarity': metrics['model1_avg_similarity']
             },
             'model2': {
                 'name': model2_config.name,
                 'dimensions': model2_config.dimensions,
                 'results': results2,
-                'avg_similarity': np.mean([r['similarity_score'] for r in results2]) if results2 else 0
-            }
+                'avg_similarity': metrics['model2_avg_similarity']
+            },
+            'common_movies': metrics['common_movies'],
+            'overlap_percentage': metrics['overlap_percentage']
         }
-        
-        # Find common movies between results
-        titles1 = {r['title'] for r in results1}
-        titles2 = {r['title'] for r in results2}
-        common_titles = titles1.intersection(titles2)
-        
-        comparison['common_movies'] = len(common_titles)
-        comparison['overlap_percentage'] = (len(common_titles) / top_k) * 100 if top_k > 0 else 0
-        
-        return comparison
-
-def load_movies_from_csv(filename: str) -> List[Dict]:
-    """Load movies from CSV file with data cleaning"""
-    movies = []
-    with open(filename, 'r', encoding='utf-8') as f:
-        reader = pd.read_csv(f)
-        for _, row in reader.iterrows():
-            # Clean data to handle NaN values
-            def clean_value(value):
-                """Clean a value for JSON serialization"""
-                if pd.isna(value) or value is None or str(value).lower() in ['nan', 'none', '']:
-                    return "Unknown"
-                return str(value)
-            
-            movies.append({
-                'id': int(row['id']),
-                'title': clean_value(row['title']),
-                'overview': clean_value(row['overview']),
-                'release_date': clean_value(row['release_date']),
-                'original_language': clean_value(row['original_language'])
-            })
-    return movies
-
-def create_comparison_visualization(comparison: Dict[str, Any]) -> go.Figure:
+
+def load_movies_from_csv(filename: str, limit: Optional[int] = None) -> List[Dict]:
+    """Load movies from CSV file with data cleaning; parsing stops after limit rows when given"""
+    # The multithreaded pyarrow reader handles full loads; it cannot stop early
+    # (no nrows support), so limited test loads use the C engine instead
+    if limit is None:
+        read_options = {'engine': 'pyarrow'}
+    else:
+        read_options = {'nrows': limit}
+    df = pd.read_csv(
+        filename,
+        encoding='utf-8',
+        usecols=['id'] + MOVIE_TEXT_COLUMNS,
+        dtype={'id': 'int64[pyarrow]'},
+        dtype_backend='pyarrow',
+        **read_options
+    )
+    
+    # Clean data column-wise to handle NaN values and ensure JSON serialization
+    # (isna() is required: Arrow nulls stringify to '<NA>', not 'nan')
+    for col in MOVIE_TEXT_COLUMNS:
+        # Translate embedded \r / \r\n to \n, as reading through a text-mode open() would
+        values = df[col].astype(str).str.replace('\r\n?', '\n', regex=True)
+        is_missing = df[col].isna() | values.str.fullmatch(_BAD_VALUE_PATTERN, case=False)
+        df[col] = values.where(~is_missing, 'Unknown')
+    
+    return df.to_dict(orient='records')
+
+def create_comparison_visualization(comparison: Dict[str, Any]) -> "go.Figure":
     """Create visualization comparing two models"""
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+    
     model1 = comparison['model1']
     model2 = comparison['model2']
     
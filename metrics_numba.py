@@ -0,0 +1,68 @@
+"""
+Similarity kernels for the model comparison metrics
+Uses the ahead-of-time compiled metrics_aot extension when it has been built
+(python metrics_numba.py), falling back to numba JIT and then to plain NumPy
+"""
+
+import numpy as np
+
+# All kernels take two contiguous float32 vectors and return a float32
+SIGNATURE = 'f4(f4[::1],f4[::1])'
+
+def _sq_l2(x, y):
+    s = np.float32(0)
+    for i in range(x.shape[0]):
+        d = x[i] - y[i]
+        s += d * d
+    return s
+
+def _dot(x, y):
+    s = np.float32(0)
+    for i in range(x.shape[0]):
+        s += x[i] * y[i]
+    return s
+
+def _cosine(x, y):
+    dot = np.float32(0)
+    xx = np.float32(0)
+    yy = np.float32(0)
+    for i in range(x.shape[0]):
+        dot += x[i] * y[i]
+        xx += x[i] * x[i]
+        yy += y[i] * y[i]
+    if xx == 0 or yy == 0:
+        return np.float32(0)
+    return dot / np.sqrt(xx * yy)
+
+try:
+    # Precompiled: no JIT warm-up on the first comparison
+    from metrics_aot import sq_l2, dot, cosine
+except ImportError:
+    try:
+        from numba import njit
+    except ImportError:
+        def sq_l2(x, y):
+            d = x - y
+            return np.float32(np.dot(d, d))
+
+        def dot(x, y):
+            return np.float32(np.dot(x, y))
+
+        def cosine(x, y):
+            denom = np.sqrt(np.dot(x, x) * np.dot(y, y))
+            return np.float32(np.dot(x, y) / denom) if denom else np.float32(0)
+    else:
+        sq_l2 = njit(SIGNATURE, fastmath=True, cache=True)(_sq_l2)
+        dot = njit(SIGNATURE, fastmath=True, cache=True)(_dot)
+        cosine = njit(SIGNATURE, fastmath=True, cache=True)(_cosine)
+
+if __name__ == "__main__":
+    # Build the metrics_aot extension module next to this file
+    from numba.pycc import CC
+
+    cc = CC('metrics_aot')
+    cc.export('sq_l2', SIGNATURE)(_sq_l2)
+    cc.export('dot', SIGNATURE)(_dot)
+    cc.export('cosine', SIGNATURE)(_cosine)
+    cc.compile()
+    print("Built metrics_aot extension")
@@ -65,6 +65,43 @@ def test_model_configurations():
         print(f"❌ Model configuration test failed: {e}")
         return False
 
+def test_int8_vectors():
+    """Test that int8-quantized embeddings build valid Pinecone vectors"""
+    print("\n🔢 Testing int8 upsert vectors...")
+    
+    try:
+        import numpy as np
+        from pinecone import Vector
+        from embedding_comparison_system import quantize_embeddings, upsert_values
+        
+        embeddings = np.random.default_rng(0).standard_normal((4, 8)).astype(np.float32)
+        values, scales = quantize_embeddings(embeddings, 'int8')
+        vectors = [
+            Vector(id=str(i), values=v, metadata={'quantization_scale': scale})
+            for i, (v, scale) in enumerate(zip(upsert_values(values), scales.tolist()))
+        ]
+        
+        try:
+            from pinecone.data.vector_factory import VectorFactory
+        except ImportError:
+            try:
+                from pinecone.db_data.vector_factory import VectorFactory
+            except ImportError:
+                VectorFactory = None
+        if VectorFactory is not None:
+            # Same type validation the REST client applies on upsert
+            for vector in vectors:
+                VectorFactory.build(vector)
+        elif not all(isinstance(x, float) for v in vectors for x in v.values):
+            print("❌ int8 vector values are not floats")
+            return False
+        
+        print(f"✅ Built {len(vectors)} int8 vectors")
+        return True
+    except Exception as e:
+        print(f"❌ int8 vector test failed: {e}")
+        return False
+
 def test_csv_file():
     """Test that the CSV file exists and is readable"""
     print("\n📁 Testing CSV file...")
@@ -121,6 +158,7 @@ def main():
     tests = [
         test_imports,
         test_model_configurations,
+        test_int8_vectors,
         test_csv_file,
         test_system_initialization
     ]
@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 """
 Quick launcher for the Embedding Comparison System
+
+Environment variables:
+    PINECONE_API_KEY  Pinecone API key (required)
+    ST_CACHE          Directory for cached sentence-transformers weights,
+                      shared across scripts (default: .st_cache in the project directory)
 """
 
 import os
@@ -29,6 +34,10 @@ def main():
         print("   or see SECURITY.md for more options")
         return
     
+    # Imported after the environment checks so a missing venv is reported first
+    from embedding_comparison_system import DEFAULT_MODEL_CACHE
+    print(f"📦 Model cache: {os.getenv('ST_CACHE', DEFAULT_MODEL_CACHE)} (set ST_CACHE to change)")
+    
     # We're already in the system directory
     # No need to change directories
     
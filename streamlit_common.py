@@ -0,0 +1,601 @@
+"""
+Shared Streamlit UI for the Embedding Model Comparison System
+Used by both streamlit_app.py and streamlit_app_optimized.py
+"""
+
+import streamlit as st
+import pandas as pd
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, wait
+import os
+from typing import Optional
+from embedding_comparison_system import (
+    EmbeddingComparisonSystem, EMBEDDING_MODELS, get_thread_pool, load_movies_from_csv, rank_metrics,
+    result_cohesion
+)
+
+# Movies dataset loaded by the sidebar
+MOVIES_CSV = 'data/horror_movies_2025.csv'
+
+# Selectbox options; EMBEDDING_MODELS is fixed at import time. Sentence-transformers
+# models have fixed output dimensions, so each model offers only its native one
+_MODEL_KEYS = tuple(EMBEDDING_MODELS.keys())
+_DIMS = {k: (v.dimensions,) for k, v in EMBEDDING_MODELS.items()}
+
+# Row limits for the optimized variant's test datasets
+DATASET_LIMITS = {"Small Test": 100, "Medium Test": 500}
+
+# Seconds between upload status redraws while indices are being populated
+UPLOAD_STATUS_INTERVAL = 0.5
+
+# Custom CSS shared by every page render
+CSS = """
+<style>
+    .main-header {
+        font-size: 2.5rem;
+        color: #1f77b4;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+    .metric-card {
+        background-color: #f0f2f6;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 4px solid #1f77b4;
+    }
+    .model-comparison {
+        background-color: #ffffff;
+        padding: 1.5rem;
+        border-radius: 0.5rem;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        margin: 1rem 0;
+    }
+</style>
+"""
+
+def setup_page(page_title: str):
+    """Configure the page; must be the first Streamlit call of an entry point"""
+    # Page configuration
+    st.set_page_config(
+        page_title=page_title,
+        page_icon="🎬",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+
+    # Custom CSS for better styling; not cached, since elements skipped on a
+    # rerun are removed from the page
+    st.html(CSS)
+
+def clear_session_state():
+    """Clear all session state variables"""
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
+
+def initialize_session_state():
+    """Initialize session state variables"""
+    if 'system' not in st.session_state:
+        st.session_state.system = None
+    if 'movies' not in st.session_state:
+        st.session_state.movies = None
+    if 'indices_created' not in st.session_state:
+        st.session_state.indices_created = {}
+    if 'model1_results' not in st.session_state:
+        st.session_state.model1_results = None
+    if 'model2_results' not in st.session_state:
+        st.session_state.model2_results = None
+    if 'comparison_results' not in st.session_state:
+        st.session_state.comparison_results = None
+
+@st.cache_resource(show_spinner=False)
+def _build_system(api_key: str) -> EmbeddingComparisonSystem:
+    """Build the system once per API key so loaded models persist across reruns and sessions"""
+    return EmbeddingComparisonSystem(api_key)
+
+def get_pool() -> ThreadPoolExecutor:
+    """Worker pool shared by every session and rerun for the upload and compare fan-outs;
+    the core module's pool, so its threads live for the lifetime of the Streamlit server process"""
+    return get_thread_pool()
+
+def load_system(api_key: str):
+    """Load the embedding comparison system with provided API key"""
+    st.session_state.system = _build_system(api_key)
+
+@st.cache_data(show_spinner=False)
+def _load_movies_cached(path: str, mtime: float, limit: Optional[int]) -> list:
+    """Parse the movies CSV; keyed on modification time so edits invalidate the cache"""
+    return load_movies_from_csv(path, limit=limit)
+
+def load_movies(path: str, limit: Optional[int] = None) -> list:
+    """Load up to limit movies from CSV, reusing the parsed result while the file is unchanged"""
+    return _load_movies_cached(path, os.path.getmtime(path), limit)
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def cached_encode(query: str, model_key: str):
+    """Encode a query once per (query, model) and reuse it across the search/compare buttons"""
+    cfg = EMBEDDING_MODELS[model_key]
+    return st.session_state.system.encode_query(query, cfg)
+
+def results_to_df(results: list) -> pd.DataFrame:
+    """Build the single DataFrame kept in session state for a result set"""
+    df = pd.DataFrame(results)
+    if not df.empty:
+        df = df.astype({'similarity_score': 'float32'})
+    return df
+
+def create_model_config(model_name: str, dimensions: int):
+    """Create a model configuration - returns the base model since dimensions are fixed"""
+    # Return the base model directly since sentence-transformers models have fixed dimensions
+    return EMBEDDING_MODELS[model_name]
+
+def sidebar_config(optimized: bool = False):
+    """Sidebar with API key, system initialization and data loading (plus dataset size when optimized)"""
+    with st.sidebar:
+        st.header("⚙️ Configuration")
+
+        # Clear session state button
+        if st.button("🗑️ Clear All Data", help="Clear all session data and start fresh"):
+            clear_session_state()
+            st.success("✅ Session cleared! Please refresh the page.")
+            st.rerun()
+
+        # Pinecone API Key input
+        pinecone_key = st.text_input(
+            "Pinecone API Key",
+            value="",
+            type="password",
+            help="Enter your Pinecone API key or set PINECONE_API_KEY environment variable"
+        )
+
+        # Load system button
+        if st.button("🔧 Initialize System"):
+            if not pinecone_key or pinecone_key == "your-pinecone-api-key-here":
+                st.error("❌ Please enter a valid Pinecone API key!")
+            else:
+                with st.spinner("Initializing system..."):
+                    load_system(pinecone_key)
+                    st.success("✅ System initialized!")
+
+        # Data loading section
+        st.header("📁 Data Management")
+
+        dataset_size = None
+        if optimized:
+            # Dataset size selection
+            dataset_size = st.selectbox(
+                "Choose dataset size:",
+                ["Full Dataset (3,743 movies)", "Small Test (100 movies)", "Medium Test (500 movies)"],
+                help="Smaller datasets for faster testing"
+            )
+
+        if st.button("📥 Load Movies Data"):
+            with st.spinner("Loading movies from CSV..."):
+                try:
+                    # Only parse as many rows as the selected dataset size needs
+                    limit = None
+                    if dataset_size is not None:
+                        limit = DATASET_LIMITS.get(dataset_size.split(" (")[0])
+                    movies = load_movies(MOVIES_CSV, limit=limit)
+
+                    if dataset_size is not None:
+                        if limit is not None:
+                            st.info(f"📊 Using {dataset_size.split(' (')[0].lower()} dataset ({limit} movies)")
+                        else:
+                            st.info("📊 Using full dataset (3,743 movies)")
+
+                    st.session_state.movies = movies
+                    st.success(f"Loaded {len(movies)} movies!")
+                except FileNotFoundError:
+                    st.error(f"CSV file not found. Please ensure '{MOVIES_CSV}' is in the current directory.")
+                except Exception as e:
+                    st.error(f"Error loading movies: {e}")
+
+        if st.session_state.movies is not None:
+            st.success(f"✅ {len(st.session_state.movies)} movies loaded")
+
+def system_status():
+    """Status indicator row"""
+    st.subheader("📊 System Status")
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        if st.session_state.system:
+            st.success("✅ System Initialized")
+        else:
+            st.error("❌ System Not Initialized")
+
+    with col2:
+        if st.session_state.movies is not None:
+            st.success("✅ Movies Loaded")
+        else:
+            st.error("❌ Movies Not Loaded")
+
+    with col3:
+        if len(st.session_state.indices_created) >= 2:
+            st.success("✅ Indices Created")
+        else:
+            st.warning(f"⚠️ {len(st.session_state.indices_created)}/2 Indices Created")
+
+    with col4:
+        if len(st.session_state.indices_created) >= 2:
+            st.success("✅ Ready to Search")
+        else:
+            st.warning("⚠️ Create Indices First")
+
+def model_selection():
+    """Model selection for both sides of the comparison; returns the two model configs"""
+    st.header("🔍 Model Selection")
+    st.info("💡 **Note**: Each embedding model has fixed dimensions that cannot be changed. The dimension dropdown shows the model's native dimensions.")
+
+    configs = []
+    for i, col in enumerate(st.columns(2), 1):
+        with col:
+            st.subheader(f"Model {i}")
+            model_name = st.selectbox(
+                f"Select Model {i}:",
+                options=_MODEL_KEYS,
+                key=f"model{i}_select"
+            )
+            model_dims = st.selectbox(
+                f"Dimensions for Model {i}:",
+                options=_DIMS[model_name],
+                key=f"model{i}_dims"
+            )
+
+            model_config = create_model_config(model_name, model_dims)
+            st.info(f"**{model_config.name}** ({model_config.dimensions}D) - {model_config.description}")
+            configs.append(model_config)
+
+    return configs[0], configs[1]
+
+def index_management(model1_config, model2_config):
+    """Create Index 1 / Create Index 2 buttons"""
+    st.header("🗄️ Index Management")
+
+    for i, (col, model_config) in enumerate(zip(st.columns(2), (model1_config, model2_config)), 1):
+        with col:
+            if st.button(f"🏗️ Create Index {i}", key=f"create_index{i}"):
+                with st.spinner(f"Creating index for {model_config.name}..."):
+                    index_name = st.session_state.system.create_index(model_config, "-ui")
+                    st.session_state.indices_created[f'index{i}'] = {
+                        'name': index_name,
+                        'config': model_config
+                    }
+                    st.success(f"✅ Index {i} created: {index_name}")
+
+def data_upload():
+    """Upload the loaded movies to both indices"""
+    if 'index1' not in st.session_state.indices_created or 'index2' not in st.session_state.indices_created:
+        return
+
+    st.header("📤 Data Upload")
+
+    if st.button("🚀 Upload Movies to Both Indices"):
+        system = st.session_state.system
+        indices = st.session_state.indices_created
+        keys = ('index1', 'index2')
+
+        # Worker threads only record progress; the script thread redraws the
+        # status at most every UPLOAD_STATUS_INTERVAL seconds
+        progress = {key: (0, len(st.session_state.movies)) for key in keys}
+
+        def make_progress_cb(key):
+            def progress_cb(done, total):
+                progress[key] = (done, total)
+            return progress_cb
+
+        with st.status("Uploading movies to both indices...", expanded=False) as status:
+            # Upload to both indices in parallel (I/O-bound Pinecone upserts)
+            pool = get_pool()
+            pending = {
+                pool.submit(
+                    system.embed_and_upload_movies,
+                    st.session_state.movies,
+                    indices[key]['config'],
+                    indices[key]['name'],
+                    progress_cb=make_progress_cb(key)
+                )
+                for key in keys
+            }
+            last_label = None
+            while pending:
+                done, pending = wait(pending, timeout=UPLOAD_STATUS_INTERVAL)
+                for future in done:
+                    future.result()
+                label = " | ".join(
+                    f"Index {i}: {progress[key][0]}/{progress[key][1]}"
+                    for i, key in enumerate(keys, 1)
+                )
+                if label != last_label:
+                    status.update(label=label)
+                    last_label = label
+
+            status.update(label="Upload complete", state="complete")
+        st.success("✅ Movies uploaded to both indices!")
+
+def _search(i: int, query: str, top_k: int):
+    """Run the Search Model i button"""
+    key = f'index{i}'
+    if key not in st.session_state.indices_created:
+        st.error(f"❌ Please create Index {i} first!")
+        return
+    if not query:
+        return
+
+    index = st.session_state.indices_created[key]
+    with st.spinner(f"Searching with Model {i}..."):
+        results = st.session_state.system.search_movies(
+            query,
+            index['config'],
+            index['name'],
+            top_k,
+            vector=cached_encode(query, index['config'].name)
+        )
+        st.session_state[f'model{i}_results'] = results
+        st.session_state[f'model{i}_df'] = results_to_df(results)
+        st.success(f"Found {len(results)} results with Model {i}")
+
+def _compare(query: str, top_k: int):
+    """Run the Compare Models button"""
+    if not (len(st.session_state.indices_created) == 2 and
+            st.session_state.model1_results is not None and
+            st.session_state.model2_results is not None):
+        return
+
+    with st.spinner("Comparing models..."):
+        system = st.session_state.system
+        index1 = st.session_state.indices_created['index1']
+        index2 = st.session_state.indices_created['index2']
+        vector1 = cached_encode(query, index1['config'].name)
+        vector2 = cached_encode(query, index2['config'].name)
+
+        # Query both indices concurrently; total latency is the slower round trip
+        pool = get_pool()
+        future1 = pool.submit(system.search_movies, query, index1['config'],
+                              index1['name'], top_k, vector1, include_vectors=True)
+        future2 = pool.submit(system.search_movies, query, index2['config'],
+                              index2['name'], top_k, vector2, include_vectors=True)
+        results1, results2 = future1.result(), future2.result()
+
+        comparison = system.build_comparison(
+            query, index1['config'], index2['config'], results1, results2, top_k
+        )
+        # The comparison keeps its own DataFrames and leaves the standalone
+        # per-model searches untouched
+        comparison['model1']['df'] = results_to_df(results1)
+        comparison['model2']['df'] = results_to_df(results2)
+        st.session_state.comparison_results = comparison
+        st.success("Comparison completed!")
+
+def _render_result_tables():
+    """Per-model results as DataFrames"""
+    for i in (1, 2):
+        if st.session_state[f'model{i}_results'] is not None:
+            st.header(f"📊 Model {i} Results")
+            results_df = st.session_state[f'model{i}_df']
+            if not results_df.empty:
+                st.dataframe(results_df[['title', 'release_date', 'similarity_score']], use_container_width=True)
+            else:
+                st.warning(f"No results found for Model {i}. Make sure you've uploaded movies to the index and clicked the search button.")
+
+def _render_result_selection(model1_config, model2_config):
+    """Per-model results as one selectable table each; the selected row's overview is shown below"""
+    if not (st.session_state.model1_results or st.session_state.model2_results):
+        return
+
+    st.header("📊 Comparison Results")
+
+    for i, (col, model_config) in enumerate(zip(st.columns(2), (model1_config, model2_config)), 1):
+        with col:
+            st.subheader(f"Model {i}: {model_config.name}")
+            results_df = st.session_state.get(f'model{i}_df')
+            if results_df is not None and not results_df.empty:
+                df = results_df[['title', 'release_date', 'original_language', 'similarity_score', 'overview']]
+                event = st.dataframe(
+                    df,
+                    key=f"model{i}_table",
+                    on_select="rerun",
+                    selection_mode="single-row",
+                    hide_index=True,
+                    use_container_width=True,
+                    column_config={'overview': None}
+                )
+                if event.selection.rows:
+                    st.write(f"**Overview:** {df.iloc[event.selection.rows[0]]['overview']}")
+            else:
+                st.warning(f"No results found for Model {i}. Make sure you've uploaded movies to the index and clicked the search button.")
+
+def _render_comparison(top_k: int):
+    """Comparison metrics, side-by-side tables, chart and overlap"""
+    comparison = st.session_state.comparison_results
+    st.header("📈 Comparison Analysis")
+
+    # Metrics cards
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        st.metric(
+            "Model 1 Avg Similarity",
+            f"{comparison['model1']['avg_similarity']:.3f}",
+            f"{comparison['model1']['name']} ({comparison['model1']['dimensions']}D)"
+        )
+
+    with col2:
+        st.metric(
+            "Model 2 Avg Similarity",
+            f"{comparison['model2']['avg_similarity']:.3f}",
+            f"{comparison['model2']['name']} ({comparison['model2']['dimensions']}D)"
+        )
+
+    with col3:
+        st.metric(
+            "Common Movies",
+            comparison['common_movies'],
+            f"out of {top_k} results"
+        )
+
+    with col4:
+        st.metric(
+            "Overlap Percentage",
+            f"{comparison['overlap_percentage']:.1f}%",
+            "between models"
+        )
+
+    # Agreement between the two models' score profiles, and how tightly each
+    # model's hits cluster in its own embedding space
+    scores = rank_metrics(comparison['model1']['results'], comparison['model2']['results'])
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    with col1:
+        st.metric(
+            "Score Profile Cosine",
+            f"{scores['score_cosine']:.3f}",
+            "rank-wise similarity scores"
+        )
+
+    with col2:
+        st.metric(
+            "Score Profile Dot Product",
+            f"{scores['score_dot']:.3f}",
+            "rank-wise similarity scores"
+        )
+
+    with col3:
+        st.metric(
+            "Score Profile Squared L2",
+            f"{scores['score_sq_l2']:.4f}",
+            "rank-wise similarity scores"
+        )
+
+    with col4:
+        st.metric(
+            "Model 1 Result Cohesion",
+            f"{result_cohesion(comparison['model1']['results']):.3f}",
+            "mean pairwise cosine"
+        )
+
+    with col5:
+        st.metric(
+            "Model 2 Result Cohesion",
+            f"{result_cohesion(comparison['model2']['results']):.3f}",
+            "mean pairwise cosine"
+        )
+
+    # Side-by-side comparison
+    st.subheader("🔍 Side-by-Side Results")
+
+    for i, col in enumerate(st.columns(2), 1):
+        with col:
+            st.write(f"**{comparison[f'model{i}']['name']} ({comparison[f'model{i}']['dimensions']}D)**")
+            model_df = comparison[f'model{i}']['df']
+            if not model_df.empty:
+                st.dataframe(
+                    model_df[['title', 'similarity_score']].rename(
+                        columns={'similarity_score': 'Score'}
+                    ),
+                    use_container_width=True
+                )
+
+    # Visualization
+    st.subheader("📊 Performance Visualization")
+
+    # Average similarity comparison chart (Vega-Lite, much lighter than a Plotly figure)
+    chart_df = pd.DataFrame({
+        'model': [comparison['model1']['name'], comparison['model2']['name']],
+        'avg_similarity': [comparison['model1']['avg_similarity'], comparison['model2']['avg_similarity']]
+    })
+    st.bar_chart(chart_df, x='model', y='avg_similarity', height=400)
+
+    # Overlap analysis
+    if comparison['common_movies'] > 0:
+        st.subheader("🎯 Overlap Analysis")
+
+        # Find common movies (sorted, de-duplicated intersection in C)
+        titles1 = np.fromiter((r['title'] for r in comparison['model1']['results']), dtype=object)
+        titles2 = np.fromiter((r['title'] for r in comparison['model2']['results']), dtype=object)
+        common_titles = np.intersect1d(titles1, titles2)
+
+        if common_titles.size:
+            st.write("**Movies found by both models:**")
+            # One element for the whole list instead of one st.write per title
+            st.write(pd.Series(common_titles, name='Common'))
+
+@st.fragment
+def query_panel(model1_config, model2_config, optimized: bool = False):
+    """Query input, search/compare buttons and results; reruns only this fragment on interaction
+
+    The optimized variant has only the two search buttons and their result tables.
+    """
+    st.header("🔍 Query & Comparison")
+
+    # Query input
+    query = st.text_input(
+        "Enter your movie query:",
+        placeholder="e.g., 'scary movies about ghosts and supernatural'",
+        value="scary movies about ghosts and supernatural"
+    )
+
+    top_k = st.slider("Number of results to return:", min_value=3, max_value=20, value=5)
+
+    # Search buttons, plus Compare Models in the full variant
+    if optimized:
+        col1, col2 = st.columns(2)
+    else:
+        col1, col2, col3 = st.columns([1, 1, 2])
+
+    with col1:
+        if st.button("🔍 Search Model 1", key="search1"):
+            _search(1, query, top_k)
+
+    with col2:
+        if st.button("🔍 Search Model 2", key="search2"):
+            _search(2, query, top_k)
+
+    if not optimized:
+        with col3:
+            if st.button("⚖️ Compare Models", key="compare"):
+                _compare(query, top_k)
+
+    # Display results
+    if optimized:
+        _render_result_selection(model1_config, model2_config)
+        return
+
+    _render_result_tables()
+
+    # Comparison visualization
+    if st.session_state.comparison_results:
+        _render_comparison(top_k)
+
+def run(subtitle: str, optimized: bool = False):
+    """Render the comparison app (optimized=True: dataset-size selector, no status panel or Compare Models)"""
+    initialize_session_state()
+
+    # Header
+    st.markdown('<h1 class="main-header">🎬 Embedding Model Comparison System</h1>', unsafe_allow_html=True)
+    st.markdown(subtitle)
+
+    # Sidebar for configuration
+    sidebar_config(optimized)
+
+    # Main content area
+    if st.session_state.system is None:
+        st.warning("⚠️ Please initialize the system first using the sidebar.")
+        return
+
+    if st.session_state.movies is None:
+        st.warning("⚠️ Please load the movies data first using the sidebar.")
+        return
+
+    if not optimized:
+        system_status()
+    model1_config, model2_config = model_selection()
+    index_management(model1_config, model2_config)
+    data_upload()
+
+    # Query and comparison section (reruns independently of the rest of the page)
+    query_panel(model1_config, model2_config, optimized)
+
+    # Footer
+    st.markdown("---")
+    st.markdown("**Embedding Model Comparison System** - Built with Streamlit and Pinecone")